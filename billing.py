@@ -1,6 +1,12 @@
 import tkinter as tk
+from ui_fonts import get_font
 
 class BillingPreviewWindow(tk.Toplevel):
+    TABLE_HEADERS = ["Sl. No.", "SAC Code", "Customer Part No.", "Description", "Qty", "Rate", "Amount"]
+    TABLE_ROWS = 8
+    TABLE_ROW_HEIGHT = 22
+    DOC_FIELDS = [("Po.No. :", "PO No"), ("DC.No. & Date", "DC No & Date"), ("CHALLAN No.", "Challan No")]
+
     def __init__(self, master, form_data, item_data):
         super().__init__(master)
         self.title("Challan Preview")
@@ -10,6 +16,25 @@ class BillingPreviewWindow(tk.Toplevel):
         self.form_data = form_data
         self.item_data = item_data
 
+        # Build the widget tree on first map, so a window closed before it is shown costs nothing
+        self._built = False
+        self.bind("<Map>", self._build_once)
+        # Closing only hides the window so show() can reuse it for the next preview
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
+
+    def show(self, form_data, item_data):
+        self.form_data = form_data
+        self.item_data = item_data
+        if self._built:
+            self._refresh_dynamic()
+        self.deiconify()
+        self.lift()
+
+    def _build_once(self, event=None):
+        if self._built:
+            return
+        self._built = True
+        self.unbind("<Map>")
         self.create_widgets()
 
     def create_widgets(self):
@@ -21,9 +46,9 @@ class BillingPreviewWindow(tk.Toplevel):
         # Header
         header_frame = tk.Frame(outer, bg="white")
         header_frame.pack(fill='x')
-        tk.Label(header_frame, text="GSTIN : 33ALQPK2156A1ZG", font=("Arial", 10, "bold"), bg="white").pack(side="left")
-        tk.Label(header_frame, text="Cell : 9443410161", font=("Arial", 10, "bold"), bg="white").pack(side="right")
-        tk.Label(outer, text="Customer ID : 17124", font=("Arial", 9), bg="white").pack(anchor='w')
+        self._lbl(header_frame, "GSTIN : 33ALQPK2156A1ZG", bold=True).pack(side="left")
+        self._lbl(header_frame, "Cell : 9443410161", bold=True).pack(side="right")
+        self._lbl(outer, "Customer ID : 17124", 9).pack(anchor='w')
 
         # Delivery Challan Box
         outer_challan_frame = tk.Frame(outer, bg="white")
@@ -32,94 +57,130 @@ class BillingPreviewWindow(tk.Toplevel):
         outer_box.pack()
         inner_box = tk.Frame(outer_box, bd=1, relief="solid", bg="white", padx=10, pady=2)
         inner_box.pack()
-        tk.Label(inner_box, text="DELIVERY CHALLAN", font=("Arial", 10, "bold"), bg="white").pack()
+        self._lbl(inner_box, "DELIVERY CHALLAN", bold=True).pack()
 
         # Company info
-        tk.Label(outer, text="SRIRAM       COATERS", font=("Arial", 18, "bold"), bg="white").pack(pady=(10, 0))
-        tk.Label(outer, text="Ambal Nagar Boothakudi Village, Viralimalai", font=("Arial", 10), bg="white").pack(pady=(0, 10))
+        self._lbl(outer, "SRIRAM       COATERS", 18, bold=True).pack(pady=(10, 0))
+        self._lbl(outer, "Ambal Nagar Boothakudi Village, Viralimalai").pack(pady=(0, 10))
 
         # TO block
         block_frame = tk.Frame(outer, bd=1, relief="solid", bg="white")
         block_frame.pack(fill="x", pady=5)
         left = tk.Frame(block_frame, bg="white")
         left.pack(side="left", fill="both", expand=True, padx=(10, 5), pady=5)
-        tk.Label(left, text="TO,", font=("Arial", 8), bg="white").pack(anchor="w")
-        tk.Label(left, text="M/s, ZF RANE AUTOMOTIVE INDIA PVT . LTD.,", font=("Arial", 10, "bold"), bg="white").pack(anchor="w")
-        tk.Label(left, text="Boothakudi Village, Viralimalai - 621316", font=("Arial", 9), bg="white").pack(anchor="w")
-        tk.Label(left, text="Pudukkottai District - 62316", font=("Arial", 9), bg="white").pack(anchor="w")
-        tk.Label(left, text="GSTIN : 33AAACR3147C1ZY", font=("Arial", 8, "bold"), bg="white").pack(anchor="w")
+        self._lbl(left, "TO,", 8).pack(anchor="w")
+        self._lbl(left, "M/s, ZF RANE AUTOMOTIVE INDIA PVT . LTD.,", bold=True).pack(anchor="w")
+        self._lbl(left, "Boothakudi Village, Viralimalai - 621316", 9).pack(anchor="w")
+        self._lbl(left, "Pudukkottai District - 62316", 9).pack(anchor="w")
+        self._lbl(left, "GSTIN : 33AAACR3147C1ZY", 8, bold=True).pack(anchor="w")
 
         separator = tk.Frame(block_frame, bg="black", width=1)
         separator.pack(side="left", fill="y")
 
         right = tk.Frame(block_frame, bg="white")
         right.pack(side="left", fill="both", expand=True, padx=(5, 10), pady=5)
-        tk.Label(right, text=f"DC.No.  : {self.form_data.get('DC No', '')}", font=("Arial", 12), bg="white").pack(anchor="w", padx=(15, 0))
-        tk.Label(right, text=f"Date      : {self.form_data.get('Date (YYYY-MM-DD)', '')}", font=("Arial", 12), bg="white").pack(anchor="w", padx=(15, 0))
+        self.dc_no_label = self._lbl(right, "", 12)
+        self.dc_no_label.pack(anchor="w", padx=(15, 0))
+        self.date_label = self._lbl(right, "", 12)
+        self.date_label.pack(anchor="w", padx=(15, 0))
 
         # PO/DC/Challan No row
         doc_frame = tk.Frame(outer, bd=1, relief="solid", bg="white")
         doc_frame.pack(fill="x", pady=(5, 0))
-        for label_text, value in [
-            ("Po.No. :", self.form_data.get("PO No", "")),
-            ("DC.No. & Date", self.form_data.get("DC No & Date", "")),
-            ("CHALLAN No.", self.form_data.get("Challan No", ""))
-        ]:
+        self.doc_value_labels = []
+        for label_text, _ in self.DOC_FIELDS:
             f = tk.Frame(doc_frame, width=200, height=80, bd=1, relief="solid", bg="white")
             f.pack(side="left", expand=True, fill="both", ipady=10)
-            tk.Label(f, text=label_text, font=("Arial", 10), bg="white").pack(anchor="n", pady=2)
-            tk.Label(f, text=value, font=("Arial", 10), bg="white").pack(anchor="center")
-
-        # Table
-        table_frame = tk.Frame(outer, bd=1, relief="solid", bg="white")
-        table_frame.pack(fill="x", pady=(10, 0))
-        headers = ["Sl. No.", "SAC Code", "Customer Part No.", "Description", "Qty", "Rate", "Amount"]
-        values = [
-            "1",
-            self.item_data.get("sac_code", ""),
-            self.item_data.get("customer_part_no", ""),
-            self.item_data.get("description", ""),
-            self.item_data.get("qty", ""),
-            self.item_data.get("rate", ""),
-            self.item_data.get("amount", "")
-        ]
-
-        # Header Row
-        for col_index, header in enumerate(headers):
-            cell = tk.Frame(table_frame, bd=1, relief="solid", bg="white", height=30)
-            cell.grid(row=0, column=col_index, sticky="nsew")
-            tk.Label(cell, text=header, font=("Arial", 9), bg="white").pack(expand=True, fill="both")
-
-        # Total 8 rows
-        total_rows = 8
+            self._lbl(f, label_text).pack(anchor="n", pady=2)
+            value_label = self._lbl(f, "")
+            value_label.pack(anchor="center")
+            self.doc_value_labels.append(value_label)
 
-        # First row: with actual item data
-        data_rows = [values] + [["" for _ in headers] for _ in range(total_rows - 1)]
-
-        for row_index, row_data in enumerate(data_rows, start=1):
-            for col_index, val in enumerate(row_data):
-                cell = tk.Frame(table_frame, bd=1, relief="solid", bg="white", height=40)
-                cell.grid(row=row_index, column=col_index, sticky="nsew")
-                tk.Label(cell, text=val, bg="white").pack(expand=True, fill="both")
-
-        # Make all columns expand evenly
-        for col_index in range(len(headers)):
-            table_frame.grid_columnconfigure(col_index, weight=1)
+        # Table: one canvas draws the grid and cell text instead of a Frame+Label per cell
+        self.table_canvas = tk.Canvas(outer, height=self.TABLE_ROW_HEIGHT * (self.TABLE_ROWS + 1) + 1,
+                                      bg="white", highlightthickness=0)
+        self.table_canvas.pack(fill="x", pady=(10, 0))
+        self.table_canvas.bind("<Configure>", self._draw_table)
 
         # Declaration
         declaration_frame = tk.Frame(outer, bd=1, relief="solid", bg="white")
         declaration_frame.pack(fill="x", pady=10)
-        tk.Label(declaration_frame, text="Recieved the above Material in good condition",
-                 font=("Arial", 10, "bold"), bg="white").pack(pady=(5, 2))
+        self._lbl(declaration_frame, "Recieved the above Material in good condition", bold=True).pack(pady=(5, 2))
 
         bottom = tk.Frame(declaration_frame, bg="white")
         bottom.pack(fill="x", padx=10)
         left_txt = "We Hearby Declare that the above mentioned goods are returned\nafter processing and no material transactions are invloved."
-        tk.Label(bottom, text=left_txt, font=("Arial", 8), bg="white", justify="left").pack(side="left", anchor="w")
-        tk.Label(bottom, text="For SRIRAM COATERS", font=("Arial", 9, "bold"), bg="white").pack(side="right", anchor="e", pady=(5, 0))
+        self._lbl(bottom, left_txt, 8, justify="left").pack(side="left", anchor="w")
+        self._lbl(bottom, "For SRIRAM COATERS", 9, bold=True).pack(side="right", anchor="e", pady=(5, 0))
 
         sign_frame = tk.Frame(declaration_frame, bg="white")
         sign_frame.pack(fill="x", pady=10)
         for label in ["Signature of Receiver", "Labour Charges Only", "Signature"]:
-            l = tk.Label(sign_frame, text=label, font=("Arial", 9), bg="white")
+            l = self._lbl(sign_frame, label, 9)
             l.pack(side="left", expand=True)
+
+        self._refresh_dynamic()
+
+    def _refresh_dynamic(self):
+        # Only the data-bound labels and the items table change between previews
+        self.dc_no_label.config(text=f"DC.No.  : {self.form_data.get('DC No', '')}")
+        self.date_label.config(text=f"Date      : {self.form_data.get('Date (YYYY-MM-DD)', '')}")
+        for value_label, (_, key) in zip(self.doc_value_labels, self.DOC_FIELDS):
+            value_label.config(text=self.form_data.get(key, ""))
+        self._draw_table()
+
+    def _font(self, size, bold=False):
+        # Owned by the app root, not this window, so it outlives any one preview
+        return get_font(self, size, bold)
+
+    def _lbl(self, parent, text, size=10, bold=False, **kwargs):
+        return tk.Label(parent, text=text, font=self._font(size, bold), bg="white", **kwargs)
+
+    def _table_rows(self):
+        values = [
+            "1",
+            self.item_data.get("sac_code", ""),
+            self.item_data.get("customer_part_no", ""),
+            self.item_data.get("description", ""),
+            self.item_data.get("qty", ""),
+            self.item_data.get("rate", ""),
+            self.item_data.get("amount", "")
+        ]
+        # First row: with actual item data, the rest left blank
+        blank = [""] * len(self.TABLE_HEADERS)
+        return [values] + [blank] * (self.TABLE_ROWS - 1)
+
+    def _draw_table(self, event=None):
+        canvas = self.table_canvas
+        canvas.delete("all")
+        width = canvas.winfo_width() - 1
+        if width <= 0:
+            return  # not laid out yet; <Configure> will draw it
+        col_w = width / len(self.TABLE_HEADERS)
+        rows = [self.TABLE_HEADERS] + self._table_rows()
+
+        # Text wraps to the column width, so each row is as tall as its tallest wrapped cell
+        y = 0
+        row_tops = [0]
+        for row_index, row_data in enumerate(rows):
+            font = self._font(9) if row_index == 0 else "TkDefaultFont"
+            items = [canvas.create_text((col_index + 0.5) * col_w, y, text=val, font=font,
+                                        width=col_w - 4, anchor="n")
+                     for col_index, val in enumerate(row_data)]
+            heights = [bbox[3] - bbox[1] if bbox else 0 for bbox in map(canvas.bbox, items)]
+            row_h = max(self.TABLE_ROW_HEIGHT, max(heights) + 6)
+            for item, text_h in zip(items, heights):
+                canvas.move(item, 0, (row_h - text_h) / 2)
+            y += row_h
+            row_tops.append(y)
+
+        # Grid lines: one item per line rather than a bordered Frame per cell
+        for col_index in range(len(self.TABLE_HEADERS) + 1):
+            x = round(col_index * col_w)
+            canvas.create_line(x, 0, x, y)
+        for row_y in row_tops:
+            canvas.create_line(0, row_y, width, row_y)
+
+        # Grow or shrink the canvas to the drawn table; an unchanged height fires no new <Configure>
+        if canvas.winfo_reqheight() != y + 1:
+            canvas.configure(height=y + 1)
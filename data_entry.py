@@ -1,14 +1,95 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import sqlite3
+import threading
+import weakref
+import logging
+from itertools import islice
 from datetime import date
-from typing import Callable
 from billing import BillingPreviewWindow
+from ui_fonts import get_font
+
+log = logging.getLogger(__name__)
+
+DB_NAME = "description.db"
+
+_SQL_COUNT_DESCRIPTIONS = "SELECT COUNT(*) FROM description_master"
+_SQL_LIST_DESCRIPTIONS = (
+    "SELECT description, customer_part_no, sac_code, rate, po_no FROM description_master ORDER BY description"
+)
+_SQL_GET_DETAILS = "SELECT customer_part_no, sac_code, rate, po_no FROM description_master WHERE description = ?"
+_SQL_INSERT_HEAD = "INSERT INTO description_master (description, customer_part_no, sac_code, rate, po_no) VALUES "
+_SQL_ROW_PLACEHOLDER = "(?, ?, ?, ?, ?)"
+_SQL_INSERT_DESCRIPTION = _SQL_INSERT_HEAD + _SQL_ROW_PLACEHOLDER
+_SQL_INSERT_NEW_DESCRIPTION = _SQL_INSERT_DESCRIPTION + " ON CONFLICT (description) DO NOTHING RETURNING id"
+
+# 5 bound params per row keeps each chunk under SQLite's 32766 variable limit
+_INSERT_CHUNK_ROWS = 6000
+
+_SAMPLE_DESCRIPTIONS = [
+    ("Paint Coating", "PC-001", "998873", 100, "fc0001-1/12"),
+    ("Powder Coating", "PC-002", "998874", 120, "fc0000-1/12"),
+]
+
+# description -> details dict, plus the ordered description list; both are
+# dropped by invalidate_description_cache() whenever description_master is written
+_details_cache = {}
+_descriptions_cache = None
+# Bumped on every invalidation; a read only fills the caches if no invalidation ran while it queried
+_cache_generation = 0
+_cache_lock = threading.Lock()
+
+_local = threading.local()
+
+
+class _ThreadConnection:
+    """Holds one thread's connection; it is closed when the thread's locals are freed or at exit."""
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn):
+        self.conn = conn
+
+
+def _connect():
+    # Each connection is only used by the thread that opened it, but exit-time cleanup
+    # may close it from another thread
+    conn = sqlite3.connect(DB_NAME, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute("PRAGMA foreign_keys=ON")
+    return conn
+
+
+def _close_quietly(conn):
+    try:
+        conn.close()
+    except sqlite3.Error:
+        log.exception("Failed to close database connection")
+
+
+def _get_conn():
+    holder = getattr(_local, "holder", None)
+    if holder is None:
+        holder = _local.holder = _ThreadConnection(_connect())
+        # Runs when the owning thread exits (its locals are dropped) or at interpreter exit
+        weakref.finalize(holder, _close_quietly, holder.conn)
+    return holder.conn
+
+def _insert_rows(cur, rows):
+    """Insert any iterable of rows with one multi-VALUES statement per chunk."""
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, _INSERT_CHUNK_ROWS))
+        if not chunk:
+            break
+        sql = _SQL_INSERT_HEAD + ", ".join([_SQL_ROW_PLACEHOLDER] * len(chunk))
+        cur.execute(sql, [value for row in chunk for value in row])
 
 def init_db():
-    conn = sqlite3.connect("description.db")
-    cur = conn.cursor()
-    cur.execute("""
+    _get_conn().execute("""
         CREATE TABLE IF NOT EXISTS description_master (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             description TEXT UNIQUE NOT NULL,
@@ -18,57 +99,87 @@ def init_db():
             po_no TEXT
         )
     """)
-    conn.commit()
-    conn.close()
 
 def insert_sample_data():
-    conn = sqlite3.connect("description.db")
+    conn = _get_conn()
     cur = conn.cursor()
-    cur.execute("SELECT COUNT(*) FROM description_master")
-    if cur.fetchone()[0] == 0:
-        cur.executemany("""
-            INSERT INTO description_master (description, customer_part_no, sac_code, rate, po_no)
-            VALUES (?, ?, ?, ?, ?)
-        """, [
-            ("Paint Coating", "PC-001", "998873", 100, "fc0001-1/12"),
-            ("Powder Coating", "PC-002", "998874", 120, "fc0000-1/12"),
-        ])
-        conn.commit()
-    conn.close()
+    cur.execute("BEGIN IMMEDIATE")
+    try:
+        cur.execute(_SQL_COUNT_DESCRIPTIONS)
+        seeded = cur.fetchone()[0] == 0
+        if seeded:
+            _insert_rows(cur, _SAMPLE_DESCRIPTIONS)
+        cur.execute("COMMIT")
+    except Exception:
+        cur.execute("ROLLBACK")
+        raise
+    if seeded:
+        invalidate_description_cache()
+
+
+def invalidate_description_cache():
+    global _descriptions_cache, _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        _descriptions_cache = None
+        _details_cache.clear()
 
 
 def get_all_descriptions():
-    conn = sqlite3.connect("description.db")
-    cur = conn.cursor()
-    cur.execute("SELECT description FROM description_master")
-    results = [row[0] for row in cur.fetchall()]
-    conn.close()
-    return results
+    global _descriptions_cache
+    with _cache_lock:
+        if _descriptions_cache is not None:
+            return list(_descriptions_cache)
+        generation = _cache_generation
+
+    cur = _get_conn().execute(_SQL_LIST_DESCRIPTIONS)
+    # One pass also primes the details cache, so selecting an entry needs no query
+    details = {
+        desc: {"customer_part_no": part_no, "sac_code": sac_code, "rate": rate, "po_no": po_no}
+        for desc, part_no, sac_code, rate, po_no in cur
+    }
+    with _cache_lock:
+        if generation == _cache_generation:
+            _details_cache.update(details)
+            _descriptions_cache = list(details)
+    return list(details)
 
 
 def get_description_details(desc):
-    conn = sqlite3.connect("description.db")
-    cur = conn.cursor()
-    cur.execute("SELECT customer_part_no, sac_code, rate, po_no FROM description_master WHERE description = ?", (desc,))
-    row = cur.fetchone()
-    conn.close()
+    with _cache_lock:
+        cached = _details_cache.get(desc)
+        generation = _cache_generation
+    if cached is not None:
+        return dict(cached)
+
+    row = _get_conn().execute(_SQL_GET_DETAILS, (desc,)).fetchone()
+    details = {}
     if row:
-        return {"customer_part_no": row[0], "sac_code": row[1], "rate": row[2], "po_no": row[3]}
-    return {}
+        part_no, sac_code, rate, po_no = row
+        details = {"customer_part_no": part_no, "sac_code": sac_code, "rate": rate, "po_no": po_no}
+    with _cache_lock:
+        if generation == _cache_generation:
+            _details_cache[desc] = details
+    return dict(details)
 
 
 def insert_description_to_db(data):
-    conn = sqlite3.connect("description.db")
+    conn = _get_conn()
     cur = conn.cursor()
+    params = (data["Description"], data["Customer Part No."], data["SAC Code"], float(data["Rate"]), data["PO No"])
+    cur.execute("BEGIN IMMEDIATE")
     try:
-        cur.execute("""
-            INSERT INTO description_master (description, customer_part_no, sac_code, rate, po_no)
-            VALUES (?, ?, ?, ?, ?)
-        """, (data["Description"], data["Customer Part No."], data["SAC Code"], float(data["Rate"]), data["PO No"]))
-        conn.commit()
-    except sqlite3.IntegrityError:
+        cur.execute(_SQL_INSERT_NEW_DESCRIPTION, params)
+        inserted = cur.fetchone() is not None
+        cur.execute("COMMIT")
+    except Exception:
+        cur.execute("ROLLBACK")
+        raise
+    if inserted:
+        invalidate_description_cache()
+    else:
         messagebox.showerror("Error", "Description already exists.")
-    conn.close()
+    return inserted
 
 
 class AddDescriptionPopup(tk.Toplevel):
@@ -81,14 +192,14 @@ class AddDescriptionPopup(tk.Toplevel):
         self.create_widgets()
 
     def create_widgets(self):
-        tk.Label(self, text="Add Description Entry", font=("Arial", 12, "bold"), bg="white").pack(pady=10)
+        tk.Label(self, text="Add Description Entry", font=get_font(self, 12, bold=True), bg="white").pack(pady=10)
 
         fields = ["Description", "Customer Part No.", "SAC Code", "Rate", "PO No"]
         self.entries = {}
 
         for field in fields:
-            tk.Label(self, text=field + ":", font=("Arial", 10), bg="white").pack(anchor="w", padx=20, pady=(5, 0))
-            entry = tk.Entry(self, width=30, font=("Arial", 10))
+            tk.Label(self, text=field + ":", font=get_font(self, 10), bg="white").pack(anchor="w", padx=20, pady=(5, 0))
+            entry = tk.Entry(self, width=30, font=get_font(self, 10))
             entry.pack(padx=20, pady=5)
             self.entries[field] = entry
 
@@ -97,10 +208,11 @@ class AddDescriptionPopup(tk.Toplevel):
     def submit(self):
         data = {key: entry.get() for key, entry in self.entries.items()}
         try:
-            insert_description_to_db(data)
-            self.on_submit(data)
-            self.destroy()
+            if insert_description_to_db(data):
+                self.on_submit(data)
+                self.destroy()
         except Exception as e:
+            log.exception("Failed to save description %r", data.get("Description"))
             messagebox.showerror("Error", str(e))
 
 class DataEntryPage(tk.Tk):
@@ -109,10 +221,12 @@ class DataEntryPage(tk.Tk):
         self.title("Delivery Challan - Data Entry")
         self.geometry("800x700")
         self.configure(bg="#f0f0f0")
+        self._calc_job = None
+        self._preview = None
         self.create_widgets()
 
     def create_widgets(self):
-        tk.Label(self, text="Delivery Challan Entry Form", font=("Arial", 14, "bold"), bg="#f0f0f0").pack(pady=10)
+        tk.Label(self, text="Delivery Challan Entry Form", font=get_font(self, 14, bold=True), bg="#f0f0f0").pack(pady=10)
 
         form_frame = tk.Frame(self, bg="white", bd=2, relief="solid", padx=20, pady=20)
         form_frame.pack(padx=20, pady=10, fill="x")
@@ -120,8 +234,8 @@ class DataEntryPage(tk.Tk):
         labels = ["DC No", "Date (YYYY-MM-DD)", "PO No", "DC No & Date", "Challan No"]
         self.entries = {}
         for i, label in enumerate(labels):
-            tk.Label(form_frame, text=label + ":", font=("Arial", 10), anchor="w", bg="white").grid(row=i, column=0, sticky="w", pady=5)
-            entry = tk.Entry(form_frame, width=30, font=("Arial", 10))
+            tk.Label(form_frame, text=label + ":", font=get_font(self, 10), anchor="w", bg="white").grid(row=i, column=0, sticky="w", pady=5)
+            entry = tk.Entry(form_frame, width=30, font=get_font(self, 10))
             entry.grid(row=i, column=1, pady=5, padx=5)
             if label == "Date (YYYY-MM-DD)":
                 entry.insert(0, str(date.today()))
@@ -131,7 +245,7 @@ class DataEntryPage(tk.Tk):
         item_frame = tk.Frame(self, bg="white", bd=2, relief="solid", padx=20, pady=20)
         item_frame.pack(padx=20, pady=10, fill="x")
 
-        tk.Label(item_frame, text="Description:", font=("Arial", 10), bg="white").grid(row=0, column=0, sticky="w")
+        tk.Label(item_frame, text="Description:", font=get_font(self, 10), bg="white").grid(row=0, column=0, sticky="w")
         self.description_cb = ttk.Combobox(item_frame, values=get_all_descriptions(), width=30, state="readonly")
         self.description_cb.grid(row=0, column=1, padx=5, pady=5)
         self.description_cb.bind("<<ComboboxSelected>>", self.fill_auto_fields)
@@ -148,12 +262,12 @@ class DataEntryPage(tk.Tk):
         # Buttons
         btn_frame = tk.Frame(self, bg="#f0f0f0")
         btn_frame.pack(pady=20)
-        tk.Button(btn_frame, text="➕ Add Description", font=("Arial", 10), command=self.add_description_popup).pack(side="left", padx=10)
-        tk.Button(btn_frame, text="🧾 Generate", font=("Arial", 10, "bold"), bg="green", fg="white", command=self.generate_ui).pack(side="left", padx=10)
+        tk.Button(btn_frame, text="➕ Add Description", font=get_font(self, 10), command=self.add_description_popup).pack(side="left", padx=10)
+        tk.Button(btn_frame, text="🧾 Generate", font=get_font(self, 10, bold=True), bg="green", fg="white", command=self.generate_ui).pack(side="left", padx=10)
 
     def _create_field(self, parent, label, row, readonly=False):
-        tk.Label(parent, text=f"{label}:", font=("Arial", 10), bg="white").grid(row=row, column=0, sticky="w")
-        entry = tk.Entry(parent, width=30, font=("Arial", 10), state="readonly" if readonly else "normal")
+        tk.Label(parent, text=f"{label}:", font=get_font(self, 10), bg="white").grid(row=row, column=0, sticky="w")
+        entry = tk.Entry(parent, width=30, font=get_font(self, 10), state="readonly" if readonly else "normal")
         entry.grid(row=row, column=1, padx=5, pady=5)
         return entry
 
@@ -172,19 +286,24 @@ class DataEntryPage(tk.Tk):
             self.entries["PO No"].insert(0, data["po_no"])  # ✅ use actual DB value
 
     def calculate_amount(self, event=None):
+        # Coalesce a burst of keystrokes into a single recalculation
+        if self._calc_job is not None:
+            self.after_cancel(self._calc_job)
+        self._calc_job = self.after(50, self._update_amount)
+
+    def _update_amount(self):
+        self._calc_job = None
         try:
-            qty = float(self.qty_entry.get())
-            rate = float(self.rate_entry.get())
-            amount = qty * rate
-            self.amount_entry.config(state="normal")
-            self.amount_entry.delete(0, tk.END)
-            self.amount_entry.insert(0, f"{amount:.2f}")
-            self.amount_entry.config(state="readonly")
+            amount = f"{float(self.qty_entry.get()) * float(self.rate_entry.get()):.2f}"
         except ValueError:
-            self.amount_entry.config(state="normal")
-            self.amount_entry.delete(0, tk.END)
-            self.amount_entry.insert(0, "")
-            self.amount_entry.config(state="readonly")
+            amount = ""
+        # <KeyRelease> also fires for arrows, Tab, Shift...; skip the entry round-trip when nothing changed
+        if amount == self.amount_entry.get():
+            return
+        self.amount_entry.config(state="normal")
+        self.amount_entry.delete(0, tk.END)
+        self.amount_entry.insert(0, amount)
+        self.amount_entry.config(state="readonly")
 
     def add_description_popup(self):
         def on_submit(data):
@@ -194,6 +313,10 @@ class DataEntryPage(tk.Tk):
         AddDescriptionPopup(self, on_submit)
 
     def generate_ui(self):
+        # Apply a still-pending amount recalculation before reading the form
+        if self._calc_job is not None:
+            self.after_cancel(self._calc_job)
+            self._update_amount()
         form_data = {k: e.get() for k, e in self.entries.items()}
         item_data = {
             "description": self.description_cb.get(),
@@ -204,10 +327,14 @@ class DataEntryPage(tk.Tk):
             "amount": self.amount_entry.get()
         }
 
-        BillingPreviewWindow(self, form_data, item_data)
+        if self._preview is None or not self._preview.winfo_exists():
+            self._preview = BillingPreviewWindow(self, form_data, item_data)
+        else:
+            self._preview.show(form_data, item_data)
 
 # At the bottom
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
     init_db()
     insert_sample_data()
     app = DataEntryPage()
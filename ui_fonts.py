@@ -0,0 +1,19 @@
+import tkinter.font as tkfont
+
+# Tk root -> {(size, bold): tkfont.Font}; a root's fonts are dropped when it is destroyed
+_FONTS = {}
+
+
+def get_font(widget, size, bold=False):
+    """Return the shared Arial font for widget's Tk root, creating it on first use."""
+    root = widget._root()
+    fonts = _FONTS.get(root)
+    if fonts is None:
+        fonts = _FONTS[root] = {}
+        # <Destroy> on the root also fires for each of its children, so only react to the root itself
+        root.bind("<Destroy>", lambda event: _FONTS.pop(root, None) if event.widget is root else None, add="+")
+    key = (size, bold)
+    font = fonts.get(key)
+    if font is None:
+        font = fonts[key] = tkfont.Font(root, family="Arial", size=size, weight="bold" if bold else "normal")
+    return font